@@ -57,17 +57,27 @@ export const supabasePublic = isBuildTime
   ? createPlaceholderClient()
   : createRealSupabasePublicClient();
 
+// Clients created lazily after build time, reused so connections stay pooled
+let runtimeSupabase: ReturnType<typeof createRealSupabaseClient> | null = null;
+let runtimeSupabasePublic: ReturnType<typeof createRealSupabasePublicClient> | null = null;
+
 // Helper function to ensure clients are available at runtime
 export const getSupabaseClient = () => {
   if (isBuildTime) {
-    return createRealSupabaseClient();
+    if (!runtimeSupabase) {
+      runtimeSupabase = createRealSupabaseClient();
+    }
+    return runtimeSupabase;
   }
   return supabase;
 };
 
 export const getSupabasePublicClient = () => {
   if (isBuildTime) {
-    return createRealSupabasePublicClient();
+    if (!runtimeSupabasePublic) {
+      runtimeSupabasePublic = createRealSupabasePublicClient();
+    }
+    return runtimeSupabasePublic;
   }
   return supabasePublic;
 };